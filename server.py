@@ -4,23 +4,55 @@ import os
 from typing import Optional
 import re
 import requests
-from bs4 import BeautifulSoup
+import urllib3
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
 from dotenv import load_dotenv
 import difflib
 import json
 import sqlite3
-from datetime import datetime, timedelta
+import itertools
+import heapq
+import ijson
+import asyncio
+import hashlib
+import functools
+import time
+from datetime import datetime, timedelta, timezone
+
+# orjson is much faster for the large card payloads; fall back to the stdlib if it is missing
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 
 # Load environment variables from a .env file
 load_dotenv()
 
 # --- DATABASE ---
-card_database = {}
+CARD_NAMES: set[str] = set()  # Names of all cards in the local database
+CARD_NAMES_ORDERED: list[str] = []  # Same names as a list, for in-order scans
+CARD_NAMES_LOWER: list[str] = []  # CARD_NAMES_ORDERED lowercased, index for index
+CARD_NAMES_BY_LOWER: dict[str, str] = {}  # Lowercased name -> canonical name
 DB_PATH = "cards.db"
 CACHE_DURATION_DAYS = 7  # Update database weekly
 LOCAL_DECK_TYPES_PATH = os.getenv('LOCAL_DECK_TYPES_PATH', 'deck-types.json')
 deck_types_local_imported = False
 
+# Blocking HTTP session for the startup card data download, which runs before the event loop
+# exists; everything fetched from inside the bot goes through the aiohttp session instead.
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': 'Mozilla/5.0'})
+DECK_IMPORT_INTERVAL_HOURS = 24  # Minimum time between API deck imports triggered by /decks
+_deck_import_task: asyncio.Task | None = None  # Background API import started by /decks, if any
+
 def init_database():
     """Initialize the SQLite database with the required schema."""
     try:
@@ -32,15 +64,41 @@ def init_database():
                 CREATE TABLE IF NOT EXISTS cards (
                     name TEXT PRIMARY KEY,
                     card_data JSON NOT NULL,
-                    last_updated TIMESTAMP NOT NULL
+                    last_updated TIMESTAMP NOT NULL,
+                    hash BLOB
                 )
             """)
             
+            # Older databases predate the change-detection hash column
+            cursor.execute("PRAGMA table_info(cards)")
+            if 'hash' not in {row[1] for row in cursor.fetchall()}:
+                cursor.execute("ALTER TABLE cards ADD COLUMN hash BLOB")
+            
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_cards_name 
                 ON cards(name COLLATE NOCASE)
             """)
             
+            # Full-text index over card names, used for autocomplete and search.
+            # It mirrors the cards table, so it has to be rebuilt after each ingest.
+            # The trigram tokenizer gives substring matches, the same test the suggestion
+            # scorer applies; indexes built with the older word tokenizer are replaced.
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'cards_fts'")
+            row = cursor.fetchone()
+            fts_exists = row is not None and 'trigram' in row[0]
+            if row is not None and not fts_exists:
+                cursor.execute("DROP TABLE cards_fts")
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS cards_fts USING fts5(
+                    name,
+                    content='cards',
+                    content_rowid='rowid',
+                    tokenize='trigram'
+                )
+            """)
+            if not fts_exists:
+                cursor.execute("INSERT INTO cards_fts(cards_fts) VALUES('rebuild')")
+            
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS metadata (
                     key TEXT PRIMARY KEY,
@@ -71,9 +129,17 @@ def init_database():
                 )
             """)
             
+            # Covering indexes so the per-card and per-deck lookups never touch the table itself;
+            # the card_name one supersedes the old single-column idx_deck_cards_card
+            cursor.execute("DROP INDEX IF EXISTS idx_deck_cards_card")
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_deck_cards_card
-                ON deck_cards(card_name)
+                CREATE INDEX IF NOT EXISTS idx_deck_cards_card_name
+                ON deck_cards(card_name, deck_id, is_extra_deck, quantity)
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_deck_cards_deck_id
+                ON deck_cards(deck_id, is_extra_deck)
             """)
             
             cursor.execute("""
@@ -81,6 +147,20 @@ def init_database():
                 ON decks(url)
             """)
             
+            # Master Duel set names, refreshed in the background for /packs
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS packs_cache (
+                    set_name TEXT PRIMARY KEY,
+                    last_seen REAL NOT NULL
+                )
+            """)
+            
+            # Give the planner statistics once so it picks the covering deck_cards indexes;
+            # bulk imports refresh them afterwards (see save_deck_to_db_many)
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                cursor.execute("ANALYZE")
+            
             conn.commit()
             print("Database initialized successfully.")
     except sqlite3.Error as e:
@@ -101,10 +181,15 @@ def should_update_database():
         with sqlite3.connect(DB_PATH) as conn:
             cursor = conn.cursor()
             
-            # Check if the database exists and has data
-            cursor.execute("SELECT last_updated FROM cards LIMIT 1")
+            # Unchanged cards keep their old timestamp, so the refresh time is tracked separately
+            cursor.execute("SELECT value FROM metadata WHERE key = 'cards_last_updated'")
             result = cursor.fetchone()
             
+            if not result:
+                # Check if the database exists and has data
+                cursor.execute("SELECT last_updated FROM cards LIMIT 1")
+                result = cursor.fetchone()
+            
             if not result:
                 return True
                 
@@ -115,7 +200,7 @@ def should_update_database():
 
 def load_card_data():
     """Loads card data from local SQLite database or downloads from YGOJSON if needed."""
-    global card_database
+    global CARD_NAMES, CARD_NAMES_ORDERED, CARD_NAMES_LOWER, CARD_NAMES_BY_LOWER
     
     try:
         init_database()
@@ -124,88 +209,115 @@ def load_card_data():
         if should_update_database():
             print("Downloading fresh card database...")
             url = "https://raw.githubusercontent.com/iconmaster5326/YGOJSON/v1/aggregate/cards.json"
-            response = requests.get(url)
+            response = SESSION.get(url, stream=True)
             response.raise_for_status()
-            cards = response.json()
+            # Stream the ~100MB array one card at a time instead of buffering and decoding it whole;
+            # use_float keeps numbers as plain floats so they can be re-encoded like the old json.loads data
+            response.raw.decode_content = True
+            cards = ijson.items(response.raw, 'item', use_float=True)
             
-            with sqlite3.connect(DB_PATH) as conn:
+            with response, sqlite3.connect(DB_PATH) as conn:
                 cursor = conn.cursor()
                 current_time = datetime.now().isoformat()
                 
                 # Begin transaction
                 cursor.execute("BEGIN TRANSACTION")
                 try:
-                    # Clear existing data
-                    cursor.execute("DELETE FROM cards")
-                    
-                    # Create temporary table for new data
-                    cursor.execute("""
-                        CREATE TEMPORARY TABLE temp_cards (
-                            name TEXT PRIMARY KEY,
-                            card_data JSON,
-                            last_updated TIMESTAMP
-                        )
-                    """)
+                    # Hashes of the stored cards, so unchanged cards are not rewritten
+                    cursor.execute("SELECT name, hash FROM cards")
+                    stored_hashes = dict(cursor.fetchall())
                     
-                    # Insert new data into temporary table
+                    updates = []
+                    seen = set()
                     for card in cards:
                         try:
                             name = card['text']['en']['name']
-                            cursor.execute(
-                                "INSERT OR REPLACE INTO temp_cards (name, card_data, last_updated) VALUES (?, ?, ?)",
-                                (name, json.dumps(card), current_time)
-                            )
                         except KeyError:
                             # Skip cards without English names
                             continue
+                        blob = _json_dumps(card)
+                        card_hash = hashlib.blake2b(blob.encode('utf-8'), digest_size=8).digest()
+                        seen.add(name)
+                        if stored_hashes.get(name) != card_hash:
+                            updates.append((name, blob, current_time, card_hash))
+                    
+                    cursor.executemany(
+                        "INSERT OR REPLACE INTO cards (name, card_data, last_updated, hash) VALUES (?, ?, ?, ?)",
+                        updates
+                    )
+                    
+                    # Remove cards that are no longer in the upstream data
+                    removed = [(name,) for name in stored_hashes.keys() - seen]
+                    cursor.executemany("DELETE FROM cards WHERE name = ?", removed)
                     
-                    # Move data from temporary table to main table
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO cards (name, card_data, last_updated)
-                        SELECT name, card_data, last_updated FROM temp_cards
-                    """)
+                    cursor.execute(
+                        "INSERT OR REPLACE INTO metadata (key, value) VALUES ('cards_last_updated', ?)",
+                        (current_time,)
+                    )
                     
-                    # Drop temporary table
-                    cursor.execute("DROP TABLE temp_cards")
+                    # Re-index card names for the new data
+                    if updates or removed:
+                        cursor.execute("INSERT INTO cards_fts(cards_fts) VALUES('rebuild')")
                     
                     # Commit transaction
                     conn.commit()
-                    print("Card database updated successfully.")
+                    print(f"Card database updated successfully ({len(updates)} changed, {len(removed)} removed).")
                 except Exception as e:
                     # If anything goes wrong, roll back
                     conn.rollback()
                     raise e
         
-        # Load cards from database into memory
+        # Card data is read from the database on demand; only names are kept in memory
         print("Loading cards from local database...")
+        get_card_data.cache_clear()
+        _cached_card_suggestions.cache_clear()
         with sqlite3.connect(DB_PATH) as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT name, card_data FROM cards")
-            rows = cursor.fetchall()
+            cursor.execute("SELECT name FROM cards")
+            CARD_NAMES_ORDERED = [row[0] for row in cursor.fetchall()]
+            CARD_NAMES_LOWER = [name.lower() for name in CARD_NAMES_ORDERED]
+            CARD_NAMES = set(CARD_NAMES_ORDERED)
+            CARD_NAMES_BY_LOWER = dict(zip(CARD_NAMES_LOWER, CARD_NAMES_ORDERED))
             
-            card_database = {
-                row[0]: json.loads(row[1])
-                for row in rows
-            }
-            
-            print(f"Successfully loaded {len(card_database)} cards.")
+            print(f"Successfully loaded {len(CARD_NAMES)} cards.")
     
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, ijson.JSONError) as e:
         print(f"Error downloading card database: {e}")
         # Try to load from existing database even if download failed
         try:
             with sqlite3.connect(DB_PATH) as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT name, card_data FROM cards")
-                rows = cursor.fetchall()
-                card_database = {row[0]: json.loads(row[1]) for row in rows}
-                print(f"Loaded {len(card_database)} cards from existing database.")
+                cursor.execute("SELECT name FROM cards")
+                CARD_NAMES_ORDERED = [row[0] for row in cursor.fetchall()]
+                CARD_NAMES_LOWER = [name.lower() for name in CARD_NAMES_ORDERED]
+                CARD_NAMES = set(CARD_NAMES_ORDERED)
+                CARD_NAMES_BY_LOWER = dict(zip(CARD_NAMES_LOWER, CARD_NAMES_ORDERED))
+                print(f"Loaded {len(CARD_NAMES)} cards from existing database.")
         except Exception as db_e:
             print(f"Error loading from local database: {db_e}")
     
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
 
+@functools.lru_cache(maxsize=256)
+def get_card_data(name: str) -> dict | None:
+    """Fetch and decode a single card's data from the database. Returns None if missing."""
+    try:
+        with sqlite3.connect(DB_PATH) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT card_data FROM cards WHERE name = ?", (name,))
+            row = cursor.fetchone()
+            return _json_loads(row[0]) if row else None
+    except Exception as e:
+        print(f"Error reading card '{name}' from database: {e}")
+        return None
+
+async def get_card(name: str) -> dict | None:
+    """Load a card's data without blocking the event loop. Returns None for unknown names."""
+    if name not in CARD_NAMES:
+        return None
+    return await asyncio.to_thread(get_card_data, name)
+
 
 # --- BOT SETUP ---
 # Define the specific permissions (intents) the bot needs
@@ -218,11 +330,18 @@ class YuGiOhBot(discord.Client):
         # CommandTree holds all the application commands
         self.tree = app_commands.CommandTree(self)
 
+    async def close(self):
+        if _HTTP is not None and not _HTTP.closed:
+            await _HTTP.close()
+        await super().close()
+
     async def setup_hook(self):
         # This is called once when the bot logs in, before it's ready.
         # It's the ideal place to sync application commands.
         await self.tree.sync()
         print('Slash commands have been synchronized.')
+        # Keep the stored pack list fresh; the reference stops the task from being garbage collected
+        self.packs_refresh_task = asyncio.create_task(refresh_packs_loop())
 
     async def on_ready(self):
         if self.user:
@@ -238,6 +357,13 @@ class ArtworkView(ui.View):
         self.current_index = 0
         self.embed = embed
 
+        # Build one embed per artwork up front so a click only swaps embeds
+        self._embeds = []
+        for url in image_urls:
+            e = embed.copy()
+            e.set_image(url=url)
+            self._embeds.append(e)
+
         # Disable buttons if there's only one or zero images
         if len(self.image_urls) <= 1:
             self.prev_button.disabled = True
@@ -246,66 +372,172 @@ class ArtworkView(ui.View):
     @ui.button(label="< Prev", style=discord.ButtonStyle.secondary)
     async def prev_button(self, interaction: discord.Interaction, button: ui.Button):
         self.current_index = (self.current_index - 1) % len(self.image_urls)
-        self.embed.set_image(url=self.image_urls[self.current_index])
-        await interaction.response.edit_message(embed=self.embed)
+        await interaction.response.edit_message(embed=self._embeds[self.current_index])
 
     @ui.button(label="> Next", style=discord.ButtonStyle.secondary)
     async def next_button(self, interaction: discord.Interaction, button: ui.Button):
         self.current_index = (self.current_index + 1) % len(self.image_urls)
-        self.embed.set_image(url=self.image_urls[self.current_index])
-        await interaction.response.edit_message(embed=self.embed)
+        await interaction.response.edit_message(embed=self._embeds[self.current_index])
 
 # Instantiate the bot
 client = YuGiOhBot(intents=intents)
 
+# Shared HTTP session for the scraping commands, created on first use and closed with the bot
+_HTTP: aiohttp.ClientSession | None = None
+
+def _get_http() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it inside the running event loop if needed."""
+    global _HTTP
+    if _HTTP is None or _HTTP.closed:
+        _HTTP = aiohttp.ClientSession(
+            headers={'User-Agent': 'Mozilla/5.0'},
+            timeout=aiohttp.ClientTimeout(total=15),
+            connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+        )
+    return _HTTP
+
+async def fetch_bytes(url: str) -> bytes:
+    """Download a response body with the shared session, bypassing the page cache."""
+    async with _get_http().get(url) as response:
+        response.raise_for_status()
+        return await response.read()
+
+# Scraped pages change at most weekly, so keep them for a while and revalidate afterwards
+PAGE_CACHE_TTL_SECONDS = 600
+_PAGE_CACHE: dict[str, tuple[float, str | None, str | None, bytes]] = {}  # url -> (fetched_at, etag, last_modified, body)
+_SOUP_CACHE: dict[str, tuple[bytes, BeautifulSoup]] = {}  # url -> (body it was parsed from, soup)
+_BANLIST_INDEX: dict[str, tuple[str, str, str]] = {}  # alt_lower -> (status, official name, image url)
+_BANLIST_SOURCE: bytes | None = None  # Banlist page body _BANLIST_INDEX was built from
+
+async def fetch_page(url: str) -> bytes:
+    """Download a page without blocking the event loop. Raises aiohttp.ClientError on failure.
+
+    Bodies are cached per URL; within PAGE_CACHE_TTL_SECONDS the cached body is returned as-is,
+    afterwards the page is revalidated with If-None-Match/If-Modified-Since and reused on a 304.
+    """
+    cached = _PAGE_CACHE.get(url)
+    if cached and time.time() - cached[0] < PAGE_CACHE_TTL_SECONDS:
+        return cached[3]
+
+    headers = {}
+    if cached:
+        if cached[1]:
+            headers['If-None-Match'] = cached[1]
+        if cached[2]:
+            headers['If-Modified-Since'] = cached[2]
+
+    async with _get_http().get(url, headers=headers) as response:
+        if cached and response.status == 304:
+            _PAGE_CACHE[url] = (time.time(), cached[1], cached[2], cached[3])
+            return cached[3]
+        response.raise_for_status()
+        body = await response.read()
+        _PAGE_CACHE[url] = (time.time(), response.headers.get('ETag'), response.headers.get('Last-Modified'), body)
+        return body
+
+async def fetch_soup(url: str) -> BeautifulSoup:
+    """fetch_page() plus an lxml parse off the event loop, reusing the previous soup while the body is unchanged.
+
+    The cached soup is shared between calls, so callers must only read from it.
+    """
+    body = await fetch_page(url)
+    cached = _SOUP_CACHE.get(url)
+    if cached and cached[0] is body:
+        return cached[1]
+    soup = await asyncio.to_thread(BeautifulSoup, body, 'lxml')
+    _SOUP_CACHE[url] = (body, soup)
+    return soup
+
 
 # --- SLASH COMMANDS ---
 
-def get_card_suggestions(search_terms: str, max_suggestions: int = 5) -> list[str]:
-    """Get card name suggestions based on search terms."""
-    search_words = search_terms.lower().split()
+# Link marker positions and their emojis, in display order
+_LINK_ORDER = ('topleft', 'topcenter', 'topright', 'middleleft', 'middleright', 'bottomleft', 'bottomcenter', 'bottomright')
+_LINK_GLYPHS = ('↖️', '↑', '↗️', '←', '→', '↙️', '↓', '↘️')
+
+
+def _rank_card_names(names, names_lower, search_words, search_terms, max_suggestions):
+    """Score card names (with their lowercased forms) against the search words and return the best ones."""
+    first_word = search_words[0]
     
     # Score each card name based on how well it matches the search terms
     scored_matches = []
-    for card_name in card_database.keys():
-        card_lower = card_name.lower()
-        score = 0
-        
+    for card_name, card_lower in zip(names, names_lower):
         # Check if all search words appear in the card name
-        all_words_present = all(word in card_lower for word in search_words)
-        if all_words_present:
-            # Base score for containing all words
-            score += 100
-            
-            # Bonus for exact matches of individual words
-            for word in search_words:
-                if word in card_lower.split():
-                    score += 50
-            
-            # Bonus for matching at start of name
-            if card_lower.startswith(search_words[0]):
-                score += 25
-            
-            # Penalty based on length difference
-            length_diff = abs(len(card_lower) - len(search_terms))
-            score -= length_diff
-            
-            scored_matches.append((score, card_name))
+        if not all(word in card_lower for word in search_words):
+            continue
+        
+        # Base score for containing all words
+        score = 100
+        
+        # Bonus for exact matches of individual words
+        card_words = card_lower.split()
+        for word in search_words:
+            if word in card_words:
+                score += 50
+        
+        # Bonus for matching at start of name
+        if card_lower.startswith(first_word):
+            score += 25
+        
+        # Penalty based on length difference
+        score -= abs(len(card_lower) - len(search_terms))
+        
+        scored_matches.append((score, card_name))
     
     # Sort by score and return top matches
     scored_matches.sort(reverse=True)
     return [name for score, name in scored_matches[:max_suggestions]]
 
+def get_card_suggestions(search_terms: str, max_suggestions: int = 5) -> list[str]:
+    """Get card name suggestions based on search terms."""
+    # Autocomplete queries on every keystroke, so repeated terms are served from a cache
+    return list(_cached_card_suggestions(search_terms.lower(), max_suggestions))
+
+@functools.lru_cache(maxsize=4096)
+def _cached_card_suggestions(search_terms: str, max_suggestions: int) -> tuple[str, ...]:
+    """Compute suggestions for lowercased search terms. Cleared whenever the card data is reloaded."""
+    search_words = search_terms.split()
+    if not search_words:
+        return ()
+    
+    # An exact name is always the best single match, no need to search
+    if max_suggestions == 1:
+        direct = CARD_NAMES_BY_LOWER.get(search_terms)
+        if direct:
+            return (direct,)
+    
+    # Let the trigram index narrow the names down to those containing every word of
+    # 3+ characters (shorter words cannot be looked up in it). Words are quoted so user
+    # input is never parsed as FTS syntax. The index is only a filter: all of its
+    # matches are scored by _rank_card_names, which also checks the short words.
+    fts_words = [word for word in search_words if len(word) >= 3]
+    if fts_words:
+        fts_query = " ".join('"' + word.replace('"', '""') + '"' for word in fts_words)
+        try:
+            with sqlite3.connect(DB_PATH) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT name FROM cards_fts WHERE cards_fts MATCH ?", (fts_query,))
+                candidates = [row[0] for row in cursor.fetchall()]
+            return tuple(_rank_card_names(candidates, [c.lower() for c in candidates], search_words, search_terms, max_suggestions))
+        except sqlite3.Error as e:
+            print(f"Error searching card names: {e}")
+    
+    # Only short words (or the index is unavailable): score a substring scan over all
+    # names (lowercased once at load time)
+    return tuple(_rank_card_names(CARD_NAMES_ORDERED, CARD_NAMES_LOWER, search_words, search_terms, max_suggestions))
+
 async def card_name_autocomplete(
     interaction: discord.Interaction,
     current: str,
 ) -> list[app_commands.Choice[str]]:
     """Provides autocomplete suggestions for card names."""
     if not current:
-        # If no input yet, return some popular cards or first few in database
-        suggestions = list(card_database.keys())[:25]
+        # If no input yet, return the first few cards in the database (already in memory)
+        suggestions = CARD_NAMES_ORDERED[:25]
     else:
-        suggestions = get_card_suggestions(current, max_suggestions=25)
+        # Runs on every keystroke; keep the SQLite lookup off the event loop
+        suggestions = await asyncio.to_thread(get_card_suggestions, current, 25)
     
     return [
         app_commands.Choice(name=card_name[:100], value=card_name[:100])
@@ -329,25 +561,22 @@ async def search_card(interaction: discord.Interaction, name: str):
     except Exception as e:
         print(f"Error while deferring interaction: {e}")
 
-    if not card_database:
+    if not CARD_NAMES:
         await send_response(interaction, content="Card database is not loaded. Please check the bot's console for errors.")
         return
 
-    # Get suggestions based on the search terms
-    suggestions = get_card_suggestions(name)
+    # An exact (case-insensitive) name skips the suggestion search entirely
+    matched_name = CARD_NAMES_BY_LOWER.get(name.lower())
 
-    if not suggestions:
-        await send_response(interaction, content=f"No cards found matching '{name}'. Please check the spelling.")
-        return
+    if not matched_name:
+        # Get suggestions based on the search terms
+        suggestions = await asyncio.to_thread(get_card_suggestions, name)
 
-    # If we have an exact match, use it. Otherwise, show suggestions.
-    matched_name = None
-    for s in suggestions:
-        if s.lower() == name.lower():
-            matched_name = s
-            break
+        if not suggestions:
+            await send_response(interaction, content=f"No cards found matching '{name}'. Please check the spelling.")
+            return
 
-    if not matched_name:
+        # Without an exact match, use a single suggestion or show them all
         if len(suggestions) == 1:
             matched_name = suggestions[0]
         else:
@@ -369,7 +598,7 @@ async def search_card(interaction: discord.Interaction, name: str):
     print(f"Found match '{matched_name}' for query '{name}'")
 
     # Get the full card object from our local database
-    card_data = card_database.get(matched_name)
+    card_data = await get_card(matched_name)
     if not card_data:
         await send_response(interaction, content="Could not find card data in the local database. This should not happen.")
         return
@@ -386,17 +615,23 @@ async def search_card(interaction: discord.Interaction, name: str):
         url=url
     )
 
+    # Fields are collected as (name, value, inline) and added in one pass at the end
+    fields = []
+
+    text_en = (card_data.get('text') or {}).get('en') or {}
+    mct = card_data.get('monsterCardTypes') or ()
+
     # Check if the card is a Pendulum monster
-    is_pendulum = 'pendulum' in card_data.get('monsterCardTypes', []) or 'Pendulum' in card_data.get('type', '')
+    is_pendulum = 'pendulum' in mct or 'Pendulum' in card_data.get('type', '')
 
     if is_pendulum:
-        pendulum_effect = card_data.get('text', {}).get('en', {}).get('pendulumEffect', "No Pendulum Effect found.")
-        embed.add_field(name="Pendulum Effect", value=pendulum_effect, inline=False)
+        pendulum_effect = text_en.get('pendulumEffect', "No Pendulum Effect found.")
+        fields.append(("Pendulum Effect", pendulum_effect, False))
         
-        monster_effect = card_data.get('text', {}).get('en', {}).get('effect', "No monster effect.")
-        embed.add_field(name="Monster Effect", value=monster_effect, inline=False)
+        monster_effect = text_en.get('effect', "No monster effect.")
+        fields.append(("Monster Effect", monster_effect, False))
     else:
-        description = card_data.get('text', {}).get('en', {}).get('effect', "No description found.")
+        description = text_en.get('effect', "No description found.")
         embed.description = description
 
     if image_urls:
@@ -404,10 +639,8 @@ async def search_card(interaction: discord.Interaction, name: str):
     else:
         # Try to get image from Master Duel Meta as a fallback
         try:
-            headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            body = await fetch_bytes(url)
+            soup = await asyncio.to_thread(BeautifulSoup, body, 'lxml')
             card_image_element = soup.find('img', class_="card-image")
             if card_image_element:
                 embed.set_thumbnail(url=card_image_element['src'])
@@ -416,51 +649,36 @@ async def search_card(interaction: discord.Interaction, name: str):
 
     # Add more details to the embed
     if 'cardType' in card_data:
-        embed.add_field(name="Card Type", value=card_data['cardType'].title(), inline=True)
+        fields.append(("Card Type", card_data['cardType'].title(), True))
 
     if card_data.get('cardType') == 'monster':
         if is_pendulum:
             pendulum_scale = card_data.get('pendulumScale')
             if pendulum_scale is not None:
-                embed.add_field(name="Pendulum Scale", value=str(pendulum_scale), inline=True)
+                fields.append(("Pendulum Scale", str(pendulum_scale), True))
 
         if 'attribute' in card_data:
-            embed.add_field(name="Attribute", value=card_data['attribute'].title(), inline=True)
+            fields.append(("Attribute", card_data['attribute'].title(), True))
         
         # Check monster types
-        is_link = 'monsterCardTypes' in card_data and 'link' in card_data['monsterCardTypes']
-        is_xyz = 'monsterCardTypes' in card_data and 'xyz' in card_data['monsterCardTypes']
+        is_link = 'link' in mct
+        is_xyz = 'xyz' in mct
         
         # Handle Level/Rank/Link with appropriate markers
         if is_link and 'linkArrows' in card_data:
-            # Define link marker positions and their emojis
-            link_markers = {
-                'topleft': '↖️',
-                'topcenter': '↑',
-                'topright': '↗️',
-                'middleleft': '←',
-                'middleright': '→',
-                'bottomleft': '↙️',
-                'bottomcenter': '↓',
-                'bottomright': '↘️'
-            }
-            
-            # Convert arrows to a single line
-            arrow_symbols = []
-            for marker in sorted(card_data['linkArrows']):  # Sort to keep consistent order
-                if marker in link_markers:
-                    arrow_symbols.append(link_markers[marker])
+            # Convert arrows to a single line, in fixed marker order
+            arrow_symbols = [glyph for marker, glyph in zip(_LINK_ORDER, _LINK_GLYPHS) if marker in card_data['linkArrows']]
             
             # Create the link marker display and rating
             link_value = len(card_data['linkArrows'])
             arrows_display = ''.join(arrow_symbols)
             
             # Combine Link Rating and arrows in one field
-            embed.add_field(name="Link Rating", value=f"Link-{link_value} [{arrows_display}]", inline=True)
+            fields.append(("Link Rating", f"Link-{link_value} [{arrows_display}]", True))
             
             # For Link monsters, ATK is shown differently (no DEF)
             if 'atk' in card_data:
-                embed.add_field(name="ATK", value=f"{card_data['atk']}", inline=True)
+                fields.append(("ATK", f"{card_data['atk']}", True))
         
         elif 'rank' in card_data or 'level' in card_data:
             if is_xyz and 'rank' in card_data:
@@ -469,25 +687,28 @@ async def search_card(interaction: discord.Interaction, name: str):
                 stars = "★" * rank_value
                 if is_pendulum and 'pendulumScale' in card_data:
                     pendulum_scale = card_data.get('pendulumScale')
-                    embed.add_field(name="Rank", value=f"{rank_value} {stars} [Scale: {pendulum_scale}]", inline=True)
+                    fields.append(("Rank", f"{rank_value} {stars} [Scale: {pendulum_scale}]", True))
                 else:
-                    embed.add_field(name="Rank", value=f"{rank_value} {stars}", inline=True)
+                    fields.append(("Rank", f"{rank_value} {stars}", True))
             elif 'level' in card_data:
                 # Regular monsters use Levels with gold stars
                 level_value = card_data['level']
                 stars = "⭐" * level_value
                 if is_pendulum and 'pendulumScale' in card_data:
                     pendulum_scale = card_data.get('pendulumScale')
-                    embed.add_field(name="Level", value=f"{level_value} {stars} [Scale: {pendulum_scale}]", inline=True)
+                    fields.append(("Level", f"{level_value} {stars} [Scale: {pendulum_scale}]", True))
                 else:
-                    embed.add_field(name="Level", value=f"{level_value} {stars}", inline=True)
+                    fields.append(("Level", f"{level_value} {stars}", True))
             
             # Regular monsters and XYZ monsters show both ATK/DEF
             if 'atk' in card_data and 'def' in card_data:
-                embed.add_field(name="ATK/DEF", value=f"{card_data['atk']} / {card_data['def']}", inline=False)
+                fields.append(("ATK/DEF", f"{card_data['atk']} / {card_data['def']}", False))
         
         if 'type' in card_data:
-            embed.add_field(name="Type", value=card_data['type'], inline=False)
+            fields.append(("Type", card_data['type'], False))
+
+    for field_name, field_value, field_inline in fields:
+        embed.add_field(name=field_name, value=field_value, inline=field_inline)
 
     embed.set_footer(text="Powered by YGOJSON & MasterDuelMeta.com")
 
@@ -496,115 +717,138 @@ async def search_card(interaction: discord.Interaction, name: str):
 
     await send_response(interaction, embed=embed, view=view)
 
+DECK_CARD_BATCH_ROWS = 10000  # deck_cards rows buffered before they are written with executemany
+
+def _connect():
+    """Open a connection to the database, tuned for bulk writes."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+def _save_deck_to_db_conn(cursor, deck_info, pending_cards):
+    """Insert or update a deck row and queue its card rows in `pending_cards`.
+
+    `pending_cards` maps deck id -> deck_cards rows and is written by
+    _flush_deck_cards. A deck queued twice keeps only its latest cards.
+    """
+    # Check if the deck already exists
+    cursor.execute("SELECT id FROM decks WHERE url = ?", (deck_info['url'],))
+    existing_deck = cursor.fetchone()
+    
+    if existing_deck:
+        deck_id = existing_deck[0]
+        # Update existing deck
+        cursor.execute("""
+            UPDATE decks 
+            SET name = ?, author = ?, last_updated = CURRENT_TIMESTAMP 
+            WHERE id = ?
+        """, (deck_info['name'], deck_info['author'], deck_id))
+    else:
+        # Insert new deck
+        cursor.execute("""
+            INSERT INTO decks (name, author, url) 
+            VALUES (?, ?, ?)
+        """, (deck_info['name'], deck_info['author'], deck_info['url']))
+        deck_id = cursor.lastrowid
+    
+    # Main deck cards first, then extra deck cards
+    pending_cards[deck_id] = (
+        [(deck_id, card['name'], 0, card['count']) for card in deck_info['main_deck']] +
+        [(deck_id, card['name'], 1, card['count']) for card in deck_info['extra_deck']]
+    )
+
+def _flush_deck_cards(cursor, pending_cards):
+    """Replace the stored cards of every deck in `pending_cards`, then clear it."""
+    # Delete existing card associations
+    cursor.executemany("DELETE FROM deck_cards WHERE deck_id = ?", [(deck_id,) for deck_id in pending_cards])
+    cursor.executemany("""
+        INSERT OR REPLACE INTO deck_cards (deck_id, card_name, is_extra_deck, quantity)
+        VALUES (?, ?, ?, ?)
+    """, [row for rows in pending_cards.values() for row in rows])
+    pending_cards.clear()
+
 def save_deck_to_db(deck_info):
     """Save a deck to the database."""
+    return save_deck_to_db_many([deck_info]) == 1
+
+def save_deck_to_db_many(deck_infos, analyze=False, commit_each_batch=False):
+    """Save several decks to the database inside a single transaction.
+
+    `deck_infos` may be any iterable, including a generator; it is consumed once.
+    Card rows are written with executemany in chunks of DECK_CARD_BATCH_ROWS.
+    With `commit_each_batch=True` every chunk is committed on its own, so long
+    imports neither hold one huge transaction nor lose finished chunks on error.
+    With `analyze=True` the planner statistics are refreshed afterwards, which
+    bulk imports use since they change the table sizes considerably.
+    Returns the number of decks committed (decks in a rolled back chunk are not counted).
+    Only database errors are handled here; an exception raised while iterating
+    `deck_infos` (e.g. a failed download) rolls back the open chunk and propagates.
+    """
+    committed = 0
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with _connect() as conn:
             cursor = conn.cursor()
-            
-            # Check if the deck already exists
-            cursor.execute("SELECT id FROM decks WHERE url = ?", (deck_info['url'],))
-            existing_deck = cursor.fetchone()
-            
-            if existing_deck:
-                deck_id = existing_deck[0]
-                # Update existing deck
-                cursor.execute("""
-                    UPDATE decks 
-                    SET name = ?, author = ?, last_updated = CURRENT_TIMESTAMP 
-                    WHERE id = ?
-                """, (deck_info['name'], deck_info['author'], deck_id))
-                
-                # Delete existing card associations
-                cursor.execute("DELETE FROM deck_cards WHERE deck_id = ?", (deck_id,))
-            else:
-                # Insert new deck
-                cursor.execute("""
-                    INSERT INTO decks (name, author, url) 
-                    VALUES (?, ?, ?)
-                """, (deck_info['name'], deck_info['author'], deck_info['url']))
-                deck_id = cursor.lastrowid
-            
-            # Insert all main deck cards
-            for card in deck_info['main_deck']:
-                cursor.execute("""
-                    INSERT INTO deck_cards (deck_id, card_name, is_extra_deck, quantity)
-                    VALUES (?, ?, 0, ?)
-                """, (deck_id, card['name'], card['count']))
-            
-            # Insert all extra deck cards
-            for card in deck_info['extra_deck']:
-                cursor.execute("""
-                    INSERT INTO deck_cards (deck_id, card_name, is_extra_deck, quantity)
-                    VALUES (?, ?, 1, ?)
-                """, (deck_id, card['name'], card['count']))
-            
+            cursor.execute("BEGIN")
+            saved = 0
+            pending_cards = {}
+            pending_rows = 0
+            for deck_info in deck_infos:
+                _save_deck_to_db_conn(cursor, deck_info, pending_cards)
+                saved += 1
+                pending_rows += len(deck_info['main_deck']) + len(deck_info['extra_deck'])
+                if pending_rows >= DECK_CARD_BATCH_ROWS:
+                    _flush_deck_cards(cursor, pending_cards)
+                    pending_rows = 0
+                    if commit_each_batch:
+                        conn.commit()
+                        committed = saved
+                        cursor.execute("BEGIN")
+            _flush_deck_cards(cursor, pending_cards)
             conn.commit()
-            return True
-    except Exception as e:
-        print(f"Error saving deck to database: {e}")
-        return False
-def import_deck_by_id(deck_id, headers=None):
-    """Fetch a single deck by API ID and save it to the database.
-
-    Returns the parsed deck_info dict on success, or None on failure.
-    """
-    try:
-        if headers is None:
-            headers = {'User-Agent': 'Mozilla/5.0'}
-
-        api_url = f"https://www.masterduelmeta.com/api/v1/decks/{deck_id}"
-        resp = requests.get(api_url, headers=headers, timeout=10)
-        if resp.status_code != 200:
-            print(f"Deck API returned {resp.status_code} for id {deck_id}")
-            return None
-
-        data = resp.json()
-
-        deck_info = {
-            'name': data.get('name', f'Deck {deck_id}'),
-            'author': None,
-            'url': data.get('url') or f"https://www.masterduelmeta.com/top-decks/{deck_id}",
-            'main_deck': [],
-            'extra_deck': []
-        }
+            committed = saved
+            if analyze:
+                conn.execute("ANALYZE")
+            return saved
+    except sqlite3.Error as e:
+        print(f"Error saving decks to database: {e}")
+        return committed
 
-        # Author may be nested differently depending on API shape
-        author = data.get('author') or data.get('owner') or {}
-        if isinstance(author, dict):
-            deck_info['author'] = author.get('name') or author.get('username')
-        else:
-            deck_info['author'] = str(author) if author else None
-
-        # Cards can be in data['cards'] or data.get('decklist') depending on endpoint
-        cards = data.get('cards') or data.get('decklist') or []
-        for c in cards:
-            # support multiple possible key names
-            name = c.get('name') or c.get('cardName') or (c.get('card') or {}).get('name') or ''
-            qty = c.get('quantity') or c.get('qty') or c.get('count') or 1
-            is_extra = c.get('isExtra') or c.get('is_extra') or c.get('extra') or False
-
-            if not name:
-                continue
-
-            card_info = {'name': name, 'count': int(qty)}
-            if is_extra:
-                deck_info['extra_deck'].append(card_info)
-            else:
-                deck_info['main_deck'].append(card_info)
+def _deck_info_from_api(deck_id, data):
+    """Build a deck_info dict from a deck API response."""
+    deck_info = {
+        'name': data.get('name', f'Deck {deck_id}'),
+        'author': None,
+        'url': data.get('url') or f"https://www.masterduelmeta.com/top-decks/{deck_id}",
+        'main_deck': [],
+        'extra_deck': []
+    }
 
-        # Save deck to DB
-        saved = save_deck_to_db(deck_info)
-        if saved:
-            print(f"Imported deck {deck_info['name']} (id={deck_id}) to database")
-            return deck_info
+    # Author may be nested differently depending on API shape
+    author = data.get('author') or data.get('owner') or {}
+    if isinstance(author, dict):
+        deck_info['author'] = author.get('name') or author.get('username')
+    else:
+        deck_info['author'] = str(author) if author else None
+
+    # Cards can be in data['cards'] or data.get('decklist') depending on endpoint
+    cards = data.get('cards') or data.get('decklist') or []
+    for c in cards:
+        # support multiple possible key names
+        name = c.get('name') or c.get('cardName') or (c.get('card') or {}).get('name') or ''
+        qty = c.get('quantity') or c.get('qty') or c.get('count') or 1
+        is_extra = c.get('isExtra') or c.get('is_extra') or c.get('extra') or False
+
+        if not name:
+            continue
+
+        card_info = {'name': name, 'count': int(qty)}
+        if is_extra:
+            deck_info['extra_deck'].append(card_info)
         else:
-            return None
-
-    except Exception as e:
-        print(f"Error importing deck {deck_id} from API: {e}")
-        return None
+            deck_info['main_deck'].append(card_info)
 
+    return deck_info
 
 def extract_deck_id_from_href(href: str) -> str | None:
     """Try to extract a numeric deck id from a URL/href.
@@ -670,64 +914,122 @@ def find_deck_id_on_page(html_text: str) -> str | None:
     return None
 
 
-def import_deck_types_to_db(limit=None):
-    """Import deck types from MasterDuelMeta API and save their representative decks to the DB.
+def _resolve_card_keys(cards):
+    """Return the (name, quantity, is-extra) keys used by a deck's card dicts.
 
-    If `limit` is provided, process at most that many deck types.
-    Returns the number of decks successfully imported.
+    A source spells each key one way throughout, but may leave a key out of the
+    cards it does not apply to (e.g. isExtra only on Extra Deck cards, qty only
+    above 1), so each key is taken from the first card that has one of its
+    spellings. The first spelling is the default when no card has the key.
     """
-    try:
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        api_url = "https://www.masterduelmeta.com/api/v1/deck-types"
-        resp = requests.get(api_url, headers=headers, timeout=10)
-        resp.raise_for_status()
-        types = resp.json()
-
-        imported = 0
-        for i, t in enumerate(types):
-            if limit is not None and i >= limit:
-                break
-
-            # Try to get a deck id from the type entry
-            deck_id = t.get('id') or t.get('deck_id') or t.get('slug')
-            if not deck_id:
-                # Some entries may include an example deck in-place
-                # Try to construct a deck_info from the type entry
-                name = t.get('name') or t.get('title') or 'Unknown Deck'
-                cards = t.get('cards') or []
-                if not cards:
-                    continue
+    def first_key(*spellings):
+        for card in cards:
+            for key in spellings:
+                if key in card:
+                    return key
+        return spellings[0]
+
+    return (first_key('name', 'cardName'),
+            first_key('quantity', 'qty', 'count'),
+            first_key('is_extra', 'isExtra'))
+
+
+def _add_deck_cards(deck_info, cards, card_keys):
+    """Append deck-types card dicts to deck_info's main/extra deck lists."""
+    name_key, qty_key, extra_key = card_keys
+    main_append = deck_info['main_deck'].append
+    extra_append = deck_info['extra_deck'].append
+    for c in cards:
+        name = c.get(name_key)
+        if not name:
+            continue
+        entry = {'name': name, 'count': int(c.get(qty_key) or 1)}
+        if c.get(extra_key):
+            extra_append(entry)
+        else:
+            main_append(entry)
 
-                deck_info = {
-                    'name': name,
-                    'author': None,
-                    'url': t.get('url') or f"https://www.masterduelmeta.com/top-decks/{name.replace(' ', '-').lower()}",
-                    'main_deck': [],
-                    'extra_deck': []
-                }
 
-                for c in cards:
-                    name = c.get('name') or c.get('cardName') or ''
-                    qty = c.get('quantity') or c.get('qty') or 1
-                    is_extra = c.get('isExtra') or c.get('is_extra') or False
-                    if not name:
-                        continue
-                    entry = {'name': name, 'count': int(qty)}
-                    if is_extra:
-                        deck_info['extra_deck'].append(entry)
-                    else:
-                        deck_info['main_deck'].append(entry)
+DECK_TYPES_API_URL = "https://www.masterduelmeta.com/api/v1/deck-types"
+
+def _iter_inline_decks(entries, limit, ids):
+    """Yield the decks embedded in deck-type `entries`, appending referenced deck ids to `ids`.
+
+    At most `limit` entries are looked at when `limit` is not None.
+    """
+    for i, t in enumerate(entries):
+        if limit is not None and i >= limit:
+            break
 
-                if save_deck_to_db(deck_info):
-                    imported += 1
-                continue
+        # Try to get a deck id from the type entry
+        deck_id = t.get('id') or t.get('deck_id') or t.get('slug')
+        if deck_id:
+            ids.append(deck_id)
+            continue
 
-            # If we do have a deck id, import that deck via the decks API
-            deck = import_deck_by_id(deck_id, headers=headers)
-            if deck:
-                imported += 1
+        # Some entries may include an example deck in-place
+        # Try to construct a deck_info from the type entry
+        name = t.get('name') or t.get('title') or 'Unknown Deck'
+        cards = t.get('cards') or []
+        if not cards:
+            continue
 
+        deck_info = {
+            'name': name,
+            'author': None,
+            'url': t.get('url') or f"https://www.masterduelmeta.com/top-decks/{name.replace(' ', '-').lower()}",
+            'main_deck': [],
+            'extra_deck': []
+        }
+
+        _add_deck_cards(deck_info, cards, _resolve_card_keys(cards))
+
+        yield deck_info
+
+async def _fetch_deck_async(deck_id, semaphore):
+    """Fetch and parse a single deck from the API with the shared aiohttp session.
+
+    Returns the deck_info dict, or None on failure.
+    """
+    api_url = f"https://www.masterduelmeta.com/api/v1/decks/{deck_id}"
+    try:
+        async with semaphore:
+            async with _get_http().get(api_url) as resp:
+                if resp.status != 200:
+                    print(f"Deck API returned {resp.status} for id {deck_id}")
+                    return None
+                body = await resp.read()
+        return _deck_info_from_api(deck_id, _json_loads(body))
+    except Exception as e:
+        print(f"Error importing deck {deck_id} from API: {e}")
+        return None
+
+async def import_deck_types_to_db(limit=None):
+    """Import deck types from MasterDuelMeta API and save their representative decks to the DB.
+
+    If `limit` is provided, process at most that many deck types. The referenced
+    decks are fetched concurrently (at most 8 in flight), then saved in a worker
+    thread, committed in chunks. The import time is only recorded when every
+    referenced deck was fetched and every deck was saved, so a partly failed
+    import (e.g. rate limited deck fetches) can be retried by the next /decks.
+    Returns the number of decks imported.
+    """
+    try:
+        body = await fetch_bytes(DECK_TYPES_API_URL)
+        ids = []
+        deck_infos = list(_iter_inline_decks(_json_loads(body), limit, ids))
+
+        semaphore = asyncio.Semaphore(8)
+        fetched = await asyncio.gather(*(_fetch_deck_async(deck_id, semaphore) for deck_id in ids))
+        failed = fetched.count(None)
+        deck_infos.extend(deck for deck in fetched if deck)
+
+        imported = await asyncio.to_thread(save_deck_to_db_many, deck_infos, analyze=True, commit_each_batch=True)
         print(f"Imported {imported} deck(s) from deck-types API")
+        if failed or imported < len(deck_infos):
+            print(f"Deck import incomplete ({failed} fetch(es) failed); not recording the import time so /decks can retry")
+        else:
+            await asyncio.to_thread(set_metadata, 'last_full_import_ts', datetime.now().isoformat())
         return imported
     except Exception as e:
         print(f"Error importing deck types: {e}")
@@ -752,53 +1054,54 @@ def cleanup_old_decks(days=30):
         return 0
 
 
+def _iter_deck_types(f):
+    """Stream the entries of a deck-types JSON file opened in binary mode.
+
+    The file normally holds an array of deck-type objects; a single top-level
+    object is yielded as the only entry.
+    """
+    head = f.read(64).lstrip()
+    f.seek(0)
+    return ijson.items(f, 'item' if head.startswith(b'[') else '')
+
+
+def _iter_file_decks(f, limit=None):
+    """Yield deck_info dicts for the deck types in an open deck-types JSON file that include cards."""
+    for i, t in enumerate(_iter_deck_types(f)):
+        if limit is not None and i >= limit:
+            break
+
+        # If the type includes cards, construct deck_info
+        cards = t.get('cards') or []
+        if not cards:
+            continue
+
+        deck_info = {
+            'name': t.get('name') or t.get('title') or 'Unknown Deck',
+            'author': None,
+            'url': t.get('url') or f"https://www.masterduelmeta.com/top-decks/{t.get('id','')}",
+            'main_deck': [],
+            'extra_deck': []
+        }
+
+        _add_deck_cards(deck_info, cards, _resolve_card_keys(cards))
+
+        yield deck_info
+
 def import_deck_types_from_file(file_path, limit=None):
     """Import deck-types from a local JSON file and save decks to the DB.
 
     file_path can be a path to a JSON file containing an array of deck-type objects
-    matching the structure from the API. Returns the number of decks imported.
+    matching the structure from the API. Decks are written while the file streams,
+    committed in chunks. Returns the number of decks imported.
     """
     try:
         if not os.path.exists(file_path):
             print(f"Local deck-types file not found: {file_path}")
             return 0
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            types = json.load(f)
-
-        imported = 0
-        for i, t in enumerate(types):
-            if limit is not None and i >= limit:
-                break
-
-            # If the type includes cards, construct deck_info
-            cards = t.get('cards') or []
-            if not cards:
-                continue
-
-            deck_info = {
-                'name': t.get('name') or t.get('title') or 'Unknown Deck',
-                'author': None,
-                'url': t.get('url') or f"https://www.masterduelmeta.com/top-decks/{t.get('id','')}",
-                'main_deck': [],
-                'extra_deck': []
-            }
-
-            for c in cards:
-                name = c.get('name') or c.get('cardName') or ''
-                qty = c.get('quantity') or c.get('qty') or c.get('count') or 1
-                is_extra = c.get('isExtra') or c.get('is_extra') or False
-                if not name:
-                    continue
-                entry = {'name': name, 'count': int(qty)}
-                if is_extra:
-                    deck_info['extra_deck'].append(entry)
-                else:
-                    deck_info['main_deck'].append(entry)
-
-            if save_deck_to_db(deck_info):
-                imported += 1
-
+        with open(file_path, 'rb') as f:
+            imported = save_deck_to_db_many(_iter_file_decks(f, limit), analyze=True, commit_each_batch=True)
         print(f"Imported {imported} deck(s) from local file {file_path}")
         return imported
     except Exception as e:
@@ -815,35 +1118,26 @@ def dry_run_import_from_file(file_path, limit=5):
         if not os.path.exists(file_path):
             return 0, []
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            types = json.load(f)
-
-        total = len(types) if isinstance(types, list) else 1
+        total = 0
         previews = []
-        for i, t in enumerate(types if isinstance(types, list) else [types]):
-            if i >= limit:
-                break
-            cards = t.get('cards') or []
-            deck_info = {
-                'name': t.get('name') or t.get('title') or f'Entry {i}',
-                'author': t.get('author') or None,
-                'url': t.get('url') or None,
-                'main_deck': [],
-                'extra_deck': []
-            }
-            for c in cards:
-                name = c.get('name') or c.get('cardName') or ''
-                qty = c.get('quantity') or c.get('qty') or c.get('count') or 1
-                is_extra = c.get('isExtra') or c.get('is_extra') or False
-                if not name:
+        with open(file_path, 'rb') as f:
+            for i, t in enumerate(_iter_deck_types(f)):
+                total += 1
+                if i >= limit:
                     continue
-                entry = {'name': name, 'count': int(qty)}
-                if is_extra:
-                    deck_info['extra_deck'].append(entry)
-                else:
-                    deck_info['main_deck'].append(entry)
 
-            previews.append(deck_info)
+                cards = t.get('cards') or []
+                deck_info = {
+                    'name': t.get('name') or t.get('title') or f'Entry {i}',
+                    'author': t.get('author') or None,
+                    'url': t.get('url') or None,
+                    'main_deck': [],
+                    'extra_deck': []
+                }
+                if cards:
+                    _add_deck_cards(deck_info, cards, _resolve_card_keys(cards))
+
+                previews.append(deck_info)
 
         return total, previews
     except Exception as e:
@@ -860,25 +1154,26 @@ def analyze_deck_types_file(file_path, sample_count=1):
         if not os.path.exists(file_path):
             return {'error': 'file not found'}
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        samples = data if isinstance(data, list) else [data]
         analysis = {
-            'total_entries': len(samples),
+            'total_entries': 0,
             'samples': []
         }
 
-        for i, s in enumerate(samples[:sample_count]):
-            keys = list(s.keys()) if isinstance(s, dict) else []
-            card_keys = []
-            cards = s.get('cards') if isinstance(s, dict) else None
-            if isinstance(cards, list) and cards:
-                first_card = cards[0]
-                if isinstance(first_card, dict):
-                    card_keys = list(first_card.keys())
+        with open(file_path, 'rb') as f:
+            for i, s in enumerate(_iter_deck_types(f)):
+                analysis['total_entries'] += 1
+                if i >= sample_count:
+                    continue
+
+                keys = list(s.keys()) if isinstance(s, dict) else []
+                card_keys = []
+                cards = s.get('cards') if isinstance(s, dict) else None
+                if isinstance(cards, list) and cards:
+                    first_card = cards[0]
+                    if isinstance(first_card, dict):
+                        card_keys = list(first_card.keys())
 
-            analysis['samples'].append({'index': i, 'top_keys': keys, 'card_keys': card_keys})
+                analysis['samples'].append({'index': i, 'top_keys': keys, 'card_keys': card_keys})
 
         return analysis
     except Exception as e:
@@ -886,17 +1181,26 @@ def analyze_deck_types_file(file_path, sample_count=1):
         return {'error': str(e)}
 
 
+_metadata_ready = False  # Set once the metadata table is known to exist
+
+def _ensure_metadata_table(cursor):
+    """Create the metadata table on first use; later calls skip the DDL."""
+    global _metadata_ready
+    if not _metadata_ready:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS metadata (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )""")
+        _metadata_ready = True
+
 def get_metadata(key: str):
     """Retrieve a string value from the metadata table. Returns None if missing."""
     try:
         with sqlite3.connect(DB_PATH) as conn:
             cursor = conn.cursor()
             # Ensure metadata table exists (safe no-op if created elsewhere)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS metadata (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )""")
+            _ensure_metadata_table(cursor)
             cursor.execute("SELECT value FROM metadata WHERE key = ?", (key,))
             row = cursor.fetchone()
             return row[0] if row else None
@@ -910,11 +1214,7 @@ def set_metadata(key: str, value: str):
     try:
         with sqlite3.connect(DB_PATH) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS metadata (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )""")
+            _ensure_metadata_table(cursor)
             cursor.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)", (key, str(value)))
             conn.commit()
             return True
@@ -922,6 +1222,31 @@ def set_metadata(key: str, value: str):
         print(f"Error writing metadata '{key}': {e}")
         return False
 
+_SQL_STATS_ONE = """
+    SELECT 
+        c.card_name,
+        COUNT(DISTINCT c.deck_id) as deck_count,
+        AVG(c.quantity) as avg_copies,
+        SUM(c.is_extra_deck) as extra_deck_count,
+        SUM(1 - c.is_extra_deck) as main_deck_count
+    FROM deck_cards c
+    WHERE c.card_name = ?
+    GROUP BY c.card_name
+"""
+
+_SQL_STATS_TOP = """
+    SELECT 
+        c.card_name,
+        COUNT(DISTINCT c.deck_id) as deck_count,
+        AVG(c.quantity) as avg_copies,
+        SUM(c.is_extra_deck) as extra_deck_count,
+        SUM(1 - c.is_extra_deck) as main_deck_count
+    FROM deck_cards c
+    GROUP BY c.card_name
+    ORDER BY deck_count DESC
+    LIMIT ?
+"""
+
 def get_card_usage_stats(card_name=None, limit=10):
     """Get statistics about card usage across all decks."""
     try:
@@ -930,31 +1255,10 @@ def get_card_usage_stats(card_name=None, limit=10):
             
             if card_name:
                 # Get decks using this specific card
-                cursor.execute("""
-                    SELECT 
-                        c.card_name,
-                        COUNT(DISTINCT c.deck_id) as deck_count,
-                        AVG(c.quantity) as avg_copies,
-                        SUM(CASE WHEN c.is_extra_deck = 1 THEN 1 ELSE 0 END) as extra_deck_count,
-                        SUM(CASE WHEN c.is_extra_deck = 0 THEN 1 ELSE 0 END) as main_deck_count
-                    FROM deck_cards c
-                    WHERE c.card_name = ?
-                    GROUP BY c.card_name
-                """, (card_name,))
+                cursor.execute(_SQL_STATS_ONE, (card_name,))
             else:
                 # Get most used cards
-                cursor.execute("""
-                    SELECT 
-                        c.card_name,
-                        COUNT(DISTINCT c.deck_id) as deck_count,
-                        AVG(c.quantity) as avg_copies,
-                        SUM(CASE WHEN c.is_extra_deck = 1 THEN 1 ELSE 0 END) as extra_deck_count,
-                        SUM(CASE WHEN c.is_extra_deck = 0 THEN 1 ELSE 0 END) as main_deck_count
-                    FROM deck_cards c
-                    GROUP BY c.card_name
-                    ORDER BY deck_count DESC
-                    LIMIT ?
-                """, (limit,))
+                cursor.execute(_SQL_STATS_TOP, (limit,))
             
             return cursor.fetchall()
     except Exception as e:
@@ -967,17 +1271,28 @@ def get_deck_stats():
         with sqlite3.connect(DB_PATH) as conn:
             cursor = conn.cursor()
             
-            # Get total counts
+            # Get total counts; deck sizes come from one grouped pass over deck_cards.
+            # Everything is counted through decks, since deck_cards rows of removed decks
+            # can linger (foreign keys are not enforced), and decks without cards count as 0.
             cursor.execute("""
+                WITH sizes AS (
+                    SELECT deck_id,
+                           SUM(1 - is_extra_deck) as main_sz,
+                           SUM(is_extra_deck) as extra_sz
+                    FROM deck_cards
+                    GROUP BY deck_id
+                )
                 SELECT 
-                    COUNT(DISTINCT d.id) as total_decks,
-                    COUNT(DISTINCT dc.card_name) as unique_cards,
+                    COUNT(*) as total_decks,
+                    (SELECT COUNT(DISTINCT dc.card_name)
+                     FROM deck_cards dc
+                     JOIN decks d2 ON d2.id = dc.deck_id) as unique_cards,
                     COUNT(DISTINCT d.author) as unique_authors,
-                    AVG((SELECT COUNT(*) FROM deck_cards dc2 WHERE dc2.deck_id = d.id AND dc2.is_extra_deck = 0)) as avg_main_deck_size,
-                    AVG((SELECT COUNT(*) FROM deck_cards dc2 WHERE dc2.deck_id = d.id AND dc2.is_extra_deck = 1)) as avg_extra_deck_size,
+                    COALESCE(AVG(COALESCE(s.main_sz, 0)), 0) as avg_main_deck_size,
+                    COALESCE(AVG(COALESCE(s.extra_sz, 0)), 0) as avg_extra_deck_size,
                     MAX(d.created_at) as latest_deck_date
                 FROM decks d
-                LEFT JOIN deck_cards dc ON d.id = dc.deck_id
+                LEFT JOIN sizes s ON s.deck_id = d.id
             """)
             
             return cursor.fetchone()
@@ -991,41 +1306,26 @@ def get_decks_with_card(card_name):
         with sqlite3.connect(DB_PATH) as conn:
             cursor = conn.cursor()
             
-            # Get all decks containing the card
+            # Get all decks containing the card together with their full card lists
             cursor.execute("""
-                SELECT DISTINCT d.id, d.name, d.author, d.url, d.created_at
+                SELECT d.id, d.name, d.author, d.url, d.created_at,
+                       dc.card_name, dc.quantity, dc.is_extra_deck
                 FROM decks d
                 JOIN deck_cards dc ON d.id = dc.deck_id
-                WHERE dc.card_name = ?
-                ORDER BY d.created_at DESC
+                WHERE d.id IN (SELECT deck_id FROM deck_cards WHERE card_name = ?)
+                ORDER BY d.created_at DESC, d.id, dc.is_extra_deck
             """, (card_name,))
             
             decks = []
-            for deck_row in cursor.fetchall():
-                deck_id, name, author, url, created_at = deck_row
-                
-                # Get main deck cards
-                cursor.execute("""
-                    SELECT card_name, quantity
-                    FROM deck_cards
-                    WHERE deck_id = ? AND is_extra_deck = 0
-                """, (deck_id,))
-                main_deck = [{'name': row[0], 'count': row[1]} for row in cursor.fetchall()]
-                
-                # Get extra deck cards
-                cursor.execute("""
-                    SELECT card_name, quantity
-                    FROM deck_cards
-                    WHERE deck_id = ? AND is_extra_deck = 1
-                """, (deck_id,))
-                extra_deck = [{'name': row[0], 'count': row[1]} for row in cursor.fetchall()]
-                
+            for _, rows in itertools.groupby(cursor.fetchall(), key=lambda row: row[0]):
+                rows = list(rows)
+                _, name, author, url, created_at = rows[0][:5]
                 decks.append({
                     'name': name,
                     'author': author,
                     'url': url,
-                    'main_deck': main_deck,
-                    'extra_deck': extra_deck,
+                    'main_deck': [{'name': row[5], 'count': row[6]} for row in rows if not row[7]],
+                    'extra_deck': [{'name': row[5], 'count': row[6]} for row in rows if row[7]],
                     'created_at': created_at
                 })
             
@@ -1034,6 +1334,22 @@ def get_decks_with_card(card_name):
         print(f"Error retrieving decks from database: {e}")
         return []
 
+# Patterns used by parse_deck_list, compiled once at import
+_SEL_DECK_PART = (
+    'div[class*="deck-part" i], div[class*="deck-section" i], '
+    'section[class*="deck-part" i], section[class*="deck-section" i]'
+)
+_SEL_DECK_TABLE = 'table[class*="deck-table"], table[class*="card-table"]'
+_RE_CARD = re.compile(r'card|card-item')
+_RE_QTY = re.compile(r'^\d+x?$')
+_RE_COUNT_INT = re.compile(r'\d+')
+_RE_EXTRA_DECK = re.compile(r'Extra Deck', re.I)
+_RE_NAME_CELL = re.compile(r'name|card')
+_RE_COUNT_CELL = re.compile(r'count|quantity')
+_RE_DECK_TEXT = re.compile(r'deck.*list|card.*list')
+_RE_EXTRA_TEXT = re.compile(r'Extra Deck|Extra:', re.I)
+_RE_LINE = re.compile(r'^\s*(\d+)x?\s+(.+)$')
+
 def parse_deck_list(soup, url):
     """Parse a deck page and extract deck information."""
     deck_info = {
@@ -1043,6 +1359,9 @@ def parse_deck_list(soup, url):
         'extra_deck': [],
         'url': url
     }
+    # Card name -> total count per section; repeated names are merged as they are parsed
+    main_by_name = {}
+    extra_by_name = {}
 
     try:
         # Method 1: Try to find deck name from various header elements
@@ -1076,119 +1395,91 @@ def parse_deck_list(soup, url):
         parsed_cards = False
 
         # Strategy 1: Look for standard deck parts
-        deck_parts = soup.find_all(['div', 'section'], class_=re.compile(r'deck.*part|deck-section', re.I))
-        for part in deck_parts:
-            header = part.find(['div', 'h3', 'h4'], class_='header') or part.find(['div', 'h3', 'h4'])
-            if header:
+        try:
+            for part in soup.select(_SEL_DECK_PART):
+                header = part.find(['div', 'h3', 'h4'], class_='header') or part.find(['div', 'h3', 'h4'])
+                if header is None:
+                    continue
                 section_name = header.get_text(strip=True).lower()
-                cards = part.find_all(['div', 'span'], class_=re.compile(r'card|card-item'))
+                cards = part.find_all(['div', 'span'], class_=_RE_CARD)
+                if not cards:
+                    continue
 
-                if cards:
-                    parsed_cards = True
-                    for card in cards:
-                        try:
-                            name_element = (
-                                card.find(['span', 'div'], class_='name') or
-                                card.find(['span', 'div'], class_='card-name') or
-                                card.find('a')
-                            )
-
-                            count_element = (
-                                card.find(['span', 'div'], class_='quantity') or
-                                card.find(['span', 'div'], class_='count') or
-                                card.find(string=re.compile(r'^\d+x?$'))
-                            )
-
-                            if name_element:
-                                card_name = name_element.get_text(strip=True)
-                                card_count = 1
-
-                                if count_element:
-                                    if hasattr(count_element, "get_text"):
-                                        count_text = count_element.get_text(strip=True)
-                                    else:
-                                        count_text = str(count_element).strip()
-                                    try:
-                                        match = re.search(r'\d+', count_text)
-                                        if match:
-                                            card_count = int(match.group(0))
-                                    except (ValueError, AttributeError):
-                                        pass
-
-                                target_list = deck_info['extra_deck'] if 'extra' in section_name else deck_info['main_deck']
-                                target_list.append({'name': card_name, 'count': card_count})
-                        except Exception as e:
-                            print(f"Error parsing card in first strategy: {e}")
+                parsed_cards = True
+                target = extra_by_name if 'extra' in section_name else main_by_name
+                for card in cards:
+                    name_element = (
+                        card.find(['span', 'div'], class_='name') or
+                        card.find(['span', 'div'], class_='card-name') or
+                        card.find('a')
+                    )
+                    if name_element is None:
+                        continue
+
+                    count_element = (
+                        card.find(['span', 'div'], class_='quantity') or
+                        card.find(['span', 'div'], class_='count') or
+                        card.find(string=_RE_QTY)
+                    )
+
+                    card_name = name_element.get_text(strip=True)
+                    card_count = 1
+                    if count_element:
+                        get_text = getattr(count_element, 'get_text', None)
+                        count_text = get_text(strip=True) if get_text else str(count_element).strip()
+                        match = _RE_COUNT_INT.search(count_text)
+                        if match:
+                            card_count = int(match.group(0))
+
+                    target[card_name] = target.get(card_name, 0) + card_count
+        except Exception as e:
+            print(f"Error parsing cards in first strategy: {e}")
 
         # Strategy 2: Parse table layout
         if not parsed_cards:
-            tables = soup.find_all('table', class_=re.compile(r'deck.*table|card.*table'))
-            for table in tables:
-                try:
-                    is_extra = bool(table.find(string=re.compile(r'Extra Deck', re.I)))
-                    rows = table.find_all('tr')
+            try:
+                for table in soup.select(_SEL_DECK_TABLE):
+                    target = extra_by_name if table.find(string=_RE_EXTRA_DECK) else main_by_name
+                    for row in table.find_all('tr'):
+                        name_cell = row.find(['td', 'th'], class_=_RE_NAME_CELL)
+                        if name_cell is None:
+                            continue
+                        count_cell = row.find(['td', 'th'], class_=_RE_COUNT_CELL)
 
-                    for row in rows:
-                        try:
-                            name_cell = row.find(['td', 'th'], class_=re.compile(r'name|card'))
-                            count_cell = row.find(['td', 'th'], class_=re.compile(r'count|quantity'))
-
-                            if name_cell:
-                                card_name = name_cell.get_text(strip=True)
-                                card_count = 1
-
-                                if count_cell:
-                                    count_text = count_cell.get_text(strip=True)
-                                    try:
-                                        match = re.search(r'\d+', count_text)
-                                        if match:
-                                            card_count = int(match.group())
-                                    except (ValueError, AttributeError):
-                                        pass
-
-                                target_list = deck_info['extra_deck'] if is_extra else deck_info['main_deck']
-                                target_list.append({'name': card_name, 'count': card_count})
-                                parsed_cards = True
-                        except Exception as e:
-                            print(f"Error parsing table row: {e}")
-                except Exception as e:
-                    print(f"Error parsing table: {e}")
+                        card_name = name_cell.get_text(strip=True)
+                        card_count = 1
+                        if count_cell:
+                            match = _RE_COUNT_INT.search(count_cell.get_text(strip=True))
+                            if match:
+                                card_count = int(match.group())
+
+                        target[card_name] = target.get(card_name, 0) + card_count
+                        parsed_cards = True
+            except Exception as e:
+                print(f"Error parsing table: {e}")
 
         # Strategy 3: Parse plain text format
         if not parsed_cards:
-            text_containers = soup.find_all(['div', 'pre', 'code'], class_=re.compile(r'deck.*list|card.*list'))
-            for container in text_containers:
+            for container in soup.find_all(['div', 'pre', 'code'], class_=_RE_DECK_TEXT):
                 text_content = container.get_text(separator='\n').strip()
-                is_extra = bool(re.search(r'Extra Deck|Extra:', text_content, re.I))
+                target = extra_by_name if _RE_EXTRA_TEXT.search(text_content) else main_by_name
                 for line in text_content.splitlines():
-                    try:
-                        m = re.match(r'^\s*(\d+)x?\s+(.+)$', line)
-                        if m:
-                            count = int(m.group(1))
-                            name = m.group(2).strip()
-                            target_list = deck_info['extra_deck'] if is_extra else deck_info['main_deck']
-                            target_list.append({'name': name, 'count': count})
-                            parsed_cards = True
-                    except Exception:
-                        pass
-
-        # Clean up the results (remove duplicate names, preserve first occurrence)
-        for section in ['main_deck', 'extra_deck']:
-            seen = set()
-            cleaned = []
-            for card in deck_info[section]:
-                if card['name'] not in seen:
-                    seen.add(card['name'])
-                    cleaned.append(card)
-            deck_info[section] = cleaned
+                    m = _RE_LINE.match(line)
+                    if m is None:
+                        continue
+                    name = m.group(2).strip()
+                    target[name] = target.get(name, 0) + int(m.group(1))
+                    parsed_cards = True
 
     except Exception as e:
         print(f"Error parsing deck: {e}")
 
+    deck_info['main_deck'] = [{'name': n, 'count': c} for n, c in main_by_name.items()]
+    deck_info['extra_deck'] = [{'name': n, 'count': c} for n, c in extra_by_name.items()]
     return deck_info
 
 
-async def send_response(interaction: discord.Interaction, content: Optional[str] = None, embed: Optional[discord.Embed] = None, view: Optional[ui.View] = None, ephemeral: bool = False):
+async def send_response(interaction: discord.Interaction, content: Optional[str] = None, embed: Optional[discord.Embed] = None, view: Optional[ui.View] = None, ephemeral: bool = False, embeds: Optional[list[discord.Embed]] = None):
     """Safely send a response for an interaction.
 
     Tries in order:
@@ -1199,6 +1490,7 @@ async def send_response(interaction: discord.Interaction, content: Optional[str]
     send_kwargs = {
         'content': content,
         'embed': embed,
+        'embeds': embeds,
         'view': view,
     }
     # Filter out None values
@@ -1229,14 +1521,11 @@ def format_deck_section(deck_list, title=None):
         if not deck_list:
             return ""
         # Normalize entries and sort by count descending then name
-        normalized = [
-            {'name': c.get('name', '').strip(), 'count': int(c.get('count', 1))}
-            for c in deck_list
-            if c and c.get('name')
-        ]
-        normalized.sort(key=lambda x: (-x['count'], x['name'].lower()))
-        lines = [f"{entry['count']}x {entry['name']}" for entry in normalized]
-        return "\n".join(lines)
+        items = sorted(
+            ((int(c.get('count', 1)), c.get('name', '').strip()) for c in deck_list if c and c.get('name')),
+            key=lambda t: (-t[0], t[1].lower())
+        )
+        return "\n".join(f"{count}x {name}" for count, name in items)
     except Exception:
         # On any error, fall back to a simple safe representation
         try:
@@ -1244,6 +1533,27 @@ def format_deck_section(deck_list, title=None):
         except Exception:
             return ""
 
+def start_deck_import() -> bool:
+    """Start a background deck import from the API unless one ran recently or is still running.
+
+    Returns True if a new import was started.
+    """
+    global _deck_import_task
+    if _deck_import_task is not None and not _deck_import_task.done():
+        return False
+
+    last_import = get_metadata('last_full_import_ts')
+    if last_import:
+        try:
+            if datetime.now() - datetime.fromisoformat(last_import) < timedelta(hours=DECK_IMPORT_INTERVAL_HOURS):
+                return False
+        except ValueError:
+            pass
+
+    # Limit to 50 to keep the import short; the task reference keeps it from being garbage collected
+    _deck_import_task = asyncio.create_task(import_deck_types_to_db(limit=50))
+    return True
+
 @client.tree.command(name="decks", description="Find decks that use a specific card on Master Duel Meta.")
 @app_commands.describe(card_name="The name of the card to find decks for.")
 @app_commands.autocomplete(card_name=card_name_autocomplete)
@@ -1251,7 +1561,7 @@ async def search_decks(interaction: discord.Interaction, card_name: str):
     """Finds and lists decks that include the specified card with their complete decklists."""
     await interaction.response.defer()
 
-    if not card_database:
+    if not CARD_NAMES:
         await interaction.followup.send("Card database is not loaded. Please check the bot's console for errors.")
         return
 
@@ -1259,9 +1569,9 @@ async def search_decks(interaction: discord.Interaction, card_name: str):
     matches = []
     search_name = card_name.lower()
     if search_name.startswith("number"):
-        matches = sorted([card for card in card_database.keys() if card.lower().startswith(search_name)])
+        matches = sorted(name for name, lower in zip(CARD_NAMES_ORDERED, CARD_NAMES_LOWER) if lower.startswith(search_name))
     else:
-        matches = get_card_suggestions(card_name, max_suggestions=1)
+        matches = await asyncio.to_thread(get_card_suggestions, card_name, 1)
     
     if not matches:
         await send_response(interaction, content=f"Card '{card_name}' not found. Please check the spelling.")
@@ -1275,19 +1585,18 @@ async def search_decks(interaction: discord.Interaction, card_name: str):
         # First, check the local database for decks
         decks = get_decks_with_card(matched_card_name)
         
-        # If no decks are in the DB, try to fetch from the API and populate the DB
-        if not decks:
-            print(f"No cached decks found for {matched_card_name}. Fetching from API...")
-            imported_count = import_deck_types_to_db(limit=50) # Limit to 50 to avoid long waits
-            if imported_count > 0:
-                # Retry getting decks from the database
-                decks = get_decks_with_card(matched_card_name)
-
+        # If no decks are in the DB, refill it from the API in the background unless that
+        # already happened recently; the user is answered right away either way
         if not decks:
-            await send_response(interaction, content=f"No public decks found for **{matched_card_name}**.")
+            if start_deck_import():
+                print(f"No cached decks found for {matched_card_name}. Importing from API in the background...")
+                await send_response(interaction, content=f"No public decks found for **{matched_card_name}** yet. The deck database is being refreshed, please try again in a minute.")
+            else:
+                await send_response(interaction, content=f"No public decks found for **{matched_card_name}**.")
             return
 
         # Create an embed for each deck
+        embeds = []
         for deck in decks[:5]: # Limit to 5 decks
             embed = discord.Embed(
                 title=deck['name'] or "Unnamed Deck",
@@ -1313,13 +1622,45 @@ async def search_decks(interaction: discord.Interaction, card_name: str):
                 embed.add_field(name="Extra Deck", value=extra_deck_text, inline=False)
 
             embed.set_footer(text="Powered by MasterDuelMeta.com")
-            
-            await send_response(interaction, embed=embed)
+            embeds.append(embed)
+
+        # Followups on one interaction are sent one after another, so batch the embeds into as
+        # few messages as Discord allows (10 embeds / 6000 characters per message)
+        batch, batch_len = [], 0
+        for embed in embeds:
+            if batch and (len(batch) == 10 or batch_len + len(embed) > 6000):
+                await send_response(interaction, embeds=batch)
+                batch, batch_len = [], 0
+            batch.append(embed)
+            batch_len += len(embed)
+        await send_response(interaction, embeds=batch)
 
     except Exception as e:
         await send_response(interaction, content=f"An unexpected error occurred: {e}")
 
 
+def build_banlist_index(content: bytes) -> dict[str, tuple[str, str, str]]:
+    """Map each card on the banlist page (lowercased alt text) to its status, official name and image."""
+    # Only the status headers and card images are needed, so skip building the rest of the page
+    soup = BeautifulSoup(content, 'lxml', parse_only=SoupStrainer(['img', 'h2']))
+
+    # Walk the page once, tracking the latest status header (Forbidden, Limited,
+    # Semi-Limited) and recording it for every card image that follows
+    status_by_alt = {}
+    current_status = "Unknown Status"
+    for element in soup.find_all(['h2', 'img']):
+        if element.name == 'h2':
+            current_status = element.get_text(strip=True)
+            continue
+        alt_text = element.get('alt')
+        if not alt_text:
+            continue
+        if isinstance(alt_text, list):
+            alt_text = " ".join(alt_text)
+        status_by_alt.setdefault(str(alt_text).lower(), (current_status, str(alt_text), element.get('src')))
+    return status_by_alt
+
+
 @client.tree.command(name="banlist", description="Check the banlist status of a card.")
 @app_commands.describe(card_name="The name of the card to check.")
 async def search_banlist(interaction: discord.Interaction, card_name: str):
@@ -1335,36 +1676,24 @@ async def search_banlist(interaction: discord.Interaction, card_name: str):
     url = "https://www.masterduelmeta.com/forbidden-limited-list"
 
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.content, 'html.parser')
+        content = await fetch_page(url)
 
-        # Find all card images with an alt text
-        card_images = soup.find_all('img', alt=True)
+        # The page body is only replaced when it actually changed, so rebuild the index on a new body
+        global _BANLIST_INDEX, _BANLIST_SOURCE
+        if content is not _BANLIST_SOURCE:
+            _BANLIST_INDEX = build_banlist_index(content)
+            _BANLIST_SOURCE = content
 
-        found_card = None
-        for img in card_images:
-            alt_text = img.get('alt', "")
-            if isinstance(alt_text, list):
-                alt_text = " ".join(alt_text)
-            if str(card_name).lower() in str(alt_text).lower():
-                found_card = img
-                break
+        search_name = str(card_name).lower()
+        found_card = _BANLIST_INDEX.get(search_name)
+        if found_card is None:
+            found_card = next((entry for alt, entry in _BANLIST_INDEX.items() if search_name in alt), None)
 
         if not found_card:
             await send_response(interaction, content=f"**{card_name.title()}** is not on the Forbidden/Limited list.")
             return
 
-        # Find the status (Forbidden, Limited, Semi-Limited)
-        status_header = found_card.find_previous('h2')
-        if status_header:
-            status = status_header.get_text(strip=True)
-        else:
-            status = "Unknown Status"
-
-        card_name_official = found_card['alt']
-        card_image_url = found_card['src']
+        status, card_name_official, card_image_url = found_card
 
         # --- EMBED CREATION ---
         embed = discord.Embed(
@@ -1376,7 +1705,7 @@ async def search_banlist(interaction: discord.Interaction, card_name: str):
 
         await send_response(interaction, embed=embed)
 
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         await send_response(interaction, content=f"An error occurred while trying to fetch data: {e}")
     except Exception as e:
         await send_response(interaction, content=f"An unexpected error occurred: {e}")
@@ -1393,16 +1722,15 @@ async def latest_pack(interaction: discord.Interaction):
     latest_pack = None
 
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-        # If selection packs not found, try secret packs
-        if response.status_code == 404:
+        try:
+            soup = await fetch_soup(url)
+        except aiohttp.ClientResponseError as e:
+            # If selection packs not found, try secret packs
+            if e.status != 404:
+                raise
             pack_type = "Secret"
             url = "https://www.masterduelmeta.com/secret-packs"
-            response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-        
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.content, 'html.parser')
+            soup = await fetch_soup(url)
 
         latest_date = None
 
@@ -1447,7 +1775,7 @@ async def latest_pack(interaction: discord.Interaction):
 
         await send_response(interaction, embed=embed)
 
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         await send_response(interaction, content=f"An error occurred while trying to fetch data: {e}")
     except Exception as e:
         await send_response(interaction, content=f"An unexpected error occurred: {e}")
@@ -1463,7 +1791,7 @@ async def card_stats(interaction: discord.Interaction, card_name: str = ""):
     
     try:
         if card_name:
-            stats = get_card_usage_stats(card_name)
+            stats = await asyncio.to_thread(get_card_usage_stats, card_name)
             if not stats:
                 await interaction.followup.send(f"No data found for card: {card_name}")
                 return
@@ -1476,17 +1804,17 @@ async def card_stats(interaction: discord.Interaction, card_name: str = ""):
             
             embed.add_field(
                 name="Usage Stats",
-                value=f"""
-                • Used in {stat[1]} decks
-                • Average copies per deck: {stat[2]:.1f}
-                • Main Deck appearances: {stat[4]}
-                • Extra Deck appearances: {stat[3]}
-                """,
+                value="\n".join((
+                    f"• Used in {stat[1]} decks",
+                    f"• Average copies per deck: {stat[2]:.1f}",
+                    f"• Main Deck appearances: {stat[4]}",
+                    f"• Extra Deck appearances: {stat[3]}"
+                )),
                 inline=False
             )
         else:
             # Show most used cards
-            stats = get_card_usage_stats(limit=10)
+            stats = await asyncio.to_thread(get_card_usage_stats, limit=10)
             if not stats:
                 await interaction.followup.send("No deck data available.")
                 return
@@ -1496,15 +1824,14 @@ async def card_stats(interaction: discord.Interaction, card_name: str = ""):
                 color=discord.Color.blue()
             )
             
-            for stat in stats:
-                card_name = stat[0]
-                deck_count = stat[1]
-                avg_copies = stat[2]
-                embed.add_field(
-                    name=card_name,
-                    value=f"Used in {deck_count} decks (avg. {avg_copies:.1f} copies)",
-                    inline=False
-                )
+            embed.add_field(
+                name="Most Used Cards",
+                value="\n".join(
+                    f"**{card_name}** — {deck_count} decks (avg. {avg_copies:.1f} copies)"
+                    for card_name, deck_count, avg_copies, *_ in stats
+                ),
+                inline=False
+            )
         
         embed.set_footer(text="Based on stored deck data")
         await interaction.followup.send(embed=embed)
@@ -1518,8 +1845,13 @@ async def deck_stats_command(interaction: discord.Interaction):
     await interaction.response.defer()
     
     try:
-        stats = get_deck_stats()
-        if not stats:
+        # Run both queries off the event loop at the same time; each opens its own connection
+        stats, top_cards = await asyncio.gather(
+            asyncio.to_thread(get_deck_stats),
+            asyncio.to_thread(get_card_usage_stats, limit=5)
+        )
+        # An empty database still yields one row, with a deck count of 0
+        if not stats or not stats[0]:
             await interaction.followup.send("No deck data available.")
             return
         
@@ -1532,19 +1864,18 @@ async def deck_stats_command(interaction: discord.Interaction):
         
         embed.add_field(
             name="Overall Stats",
-            value=f"""
-            • Total Decks: {total_decks}
-            • Unique Cards Used: {unique_cards}
-            • Unique Authors: {unique_authors}
-            • Average Main Deck Size: {avg_main:.1f}
-            • Average Extra Deck Size: {avg_extra:.1f}
-            • Latest Deck Added: {latest}
-            """,
+            value="\n".join((
+                f"• Total Decks: {total_decks}",
+                f"• Unique Cards Used: {unique_cards}",
+                f"• Unique Authors: {unique_authors}",
+                f"• Average Main Deck Size: {avg_main:.1f}",
+                f"• Average Extra Deck Size: {avg_extra:.1f}",
+                f"• Latest Deck Added: {latest}"
+            )),
             inline=False
         )
         
-        # Also get top 5 most used cards
-        top_cards = get_card_usage_stats(limit=5)
+        # Also show the top 5 most used cards
         if top_cards:
             top_cards_text = "\n".join(
                 f"• {card[0]}: {card[1]} decks"
@@ -1571,7 +1902,7 @@ async def cleanup_decks_command(interaction: discord.Interaction, days: int = 30
     await interaction.response.defer()
     
     try:
-        deleted_count = cleanup_old_decks(days)
+        deleted_count = await asyncio.to_thread(cleanup_old_decks, days)
         await interaction.followup.send(
             f"Successfully cleaned up {deleted_count} decks older than {days} days."
         )
@@ -1588,7 +1919,8 @@ async def import_decktypes_command(interaction: discord.Interaction, limit: int
     try:
         # Convert 0 to None for unlimited
         api_limit = None if limit == 0 else limit
-        imported = import_deck_types_to_db(limit=api_limit)
+        # Deck fetches run concurrently on the event loop; the sqlite inserts run in a worker thread
+        imported = await import_deck_types_to_db(limit=api_limit)
         await interaction.followup.send(f"Imported {imported} deck(s) from the MasterDuelMeta API.")
     except Exception as e:
         await interaction.followup.send(f"Failed to import deck-types: {e}")
@@ -1602,11 +1934,76 @@ async def import_decktypes_local_command(interaction: discord.Interaction, path:
     await interaction.response.defer()
     try:
         api_limit = None if limit == 0 else limit
-        imported = import_deck_types_from_file(path, limit=api_limit)
+        imported = await asyncio.to_thread(import_deck_types_from_file, path, limit=api_limit)
         await interaction.followup.send(f"Imported {imported} deck(s) from local file: {path}")
     except Exception as e:
         await interaction.followup.send(f"Failed to import from local file: {e}")
 
+# Scraped command results; the tier list and pack list change at most daily
+SCRAPE_CACHE_TTL_SECONDS = 3600
+_scrape_cache: dict[str, tuple[float, bytes | None, object]] = {}  # key -> (stored_at, page body it came from, result)
+
+def _scrape_cache_get(key: str):
+    """Return the cached result for `key` if it is younger than SCRAPE_CACHE_TTL_SECONDS, else None."""
+    stored_at, _, result = _scrape_cache.get(key, (0.0, None, None))
+    if time.time() - stored_at < SCRAPE_CACHE_TTL_SECONDS:
+        return result
+    return None
+
+def _scrape_cache_for_body(key: str, body: bytes):
+    """Return the cached result for `key` if it was built from this exact page body, else None.
+
+    fetch_page hands back the same bytes object while the page is unchanged (including on
+    a 304), so an identity check is enough to skip re-parsing.
+    """
+    entry = _scrape_cache.get(key)
+    if entry is not None and entry[1] is body:
+        return entry[2]
+    return None
+
+# Compiled XPath queries for the tier list page; class tests mirror bs4's per-class matching
+_XP_TIER_SECTIONS = etree.XPath("//div[contains(@class, 'Tier')]")
+_XP_TIER_NAME = etree.XPath(".//h2")
+_XP_TIER_DECKS = etree.XPath(".//div[contains(concat(' ', normalize-space(@class), ' '), ' deck ')]")
+_XP_DECK_NAME = etree.XPath(".//span[contains(concat(' ', normalize-space(@class), ' '), ' deck-name ')]")
+_XP_DECK_LINK = etree.XPath(".//a[@href]")
+
+def _parse_tier_page(html_bytes: bytes) -> list[tuple[str, list[tuple[str, str]]]] | None:
+    """Extract (tier name, [(deck name, deck url), ...]) from the tier list page.
+
+    Tiers without any decks are left out. Returns None if the page has no tier sections.
+    """
+    try:
+        tree = lxml.html.fromstring(html_bytes)
+    except etree.ParserError:
+        return None
+
+    # Find all tier sections (e.g., Tier 1, Tier 2)
+    tier_sections = _XP_TIER_SECTIONS(tree)
+    if not tier_sections:
+        return None
+
+    tiers = []
+    for section in tier_sections:
+        tier_name_header = _XP_TIER_NAME(section)
+        if not tier_name_header:
+            continue
+        tier_name = tier_name_header[0].text_content().strip()
+
+        decks = []
+        for item in _XP_TIER_DECKS(section):
+            deck_name_span = _XP_DECK_NAME(item)
+            deck_link_a = _XP_DECK_LINK(item)
+
+            if deck_name_span and deck_link_a:
+                deck_name = deck_name_span[0].text_content().strip()
+                deck_url = "https://www.masterduelmeta.com" + deck_link_a[0].get('href')
+                decks.append((deck_name, deck_url))
+
+        if decks:
+            tiers.append((tier_name, decks))
+    return tiers
+
 @client.tree.command(name="top_decks", description="Get the top tournament decks from the tier list.")
 async def top_decks(interaction: discord.Interaction):
     """Retrieves the top tournament decks from Master Duel Meta."""
@@ -1614,57 +2011,48 @@ async def top_decks(interaction: discord.Interaction):
 
     url = "https://www.masterduelmeta.com/tier-list"
 
+    cached_embed = _scrape_cache_get('top_decks')
+    if cached_embed is not None:
+        await interaction.followup.send(embed=cached_embed)
+        return
+
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-        response.raise_for_status()
+        content = await fetch_page(url)
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # An unchanged page (fetch_page returns the same body, e.g. after a 304) reuses its embed
+        embed = _scrape_cache_for_body('top_decks', content)
+        if embed is None:
+            # Parsing is CPU-bound, so keep it off the event loop
+            tiers = await asyncio.to_thread(_parse_tier_page, content)
 
-        embed = discord.Embed(
-            title="Top Tournament Decks",
-            color=discord.Color.dark_purple(),
-            url=url
-        )
+            if tiers is None:
+                await interaction.followup.send("Could not find any tier sections on the page. The website structure might have changed.")
+                return
 
-        # Find all tier sections (e.g., Tier 1, Tier 2)
-        tier_sections = soup.find_all('div', class_=re.compile(r'Tier.*?'))
+            embed = discord.Embed(
+                title="Top Tournament Decks",
+                color=discord.Color.dark_purple(),
+                url=url
+            )
 
-        if not tier_sections:
-            await interaction.followup.send("Could not find any tier sections on the page. The website structure might have changed.")
-            return
+            for tier_name, decks in tiers:
+                embed.add_field(
+                    name=tier_name,
+                    value='\n'.join(f"[{deck_name}]({deck_url})" for deck_name, deck_url in decks),
+                    inline=False
+                )
 
-        for section in tier_sections:
-            tier_name_header = section.find('h2')
-            if not tier_name_header:
-                continue
-            tier_name = tier_name_header.get_text(strip=True)
-            deck_items = section.find_all('div', class_='deck')
-
-            if not deck_items:
-                continue
-
-            deck_links = []
-            for item in deck_items:
-                deck_name_span = item.find('span', class_='deck-name')
-                deck_link_a = item.find('a', href=True)
-
-                if deck_name_span and deck_link_a:
-                    deck_name = deck_name_span.get_text(strip=True)
-                    deck_url = "https://www.masterduelmeta.com" + str(deck_link_a['href'])
-                    deck_links.append(f"[{deck_name}]({deck_url})")
-            
-            if deck_links:
-                embed.add_field(name=tier_name, value='\n'.join(deck_links), inline=False)
+            if not embed.fields:
+                await interaction.followup.send("No decks found on the tier list page.")
+                return
 
-        if not embed.fields:
-            await interaction.followup.send("No decks found on the tier list page.")
-            return
+            embed.set_footer(text="Powered by MasterDuelMeta.com")
 
-        embed.set_footer(text="Powered by MasterDuelMeta.com")
+        _scrape_cache['top_decks'] = (time.time(), content, embed)
 
         await interaction.followup.send(embed=embed)
 
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         await interaction.followup.send(f"An error occurred while trying to fetch data: {e}")
     except Exception as e:
         await interaction.followup.send(f"An unexpected error occurred: {e}")
@@ -1672,46 +2060,141 @@ async def top_decks(interaction: discord.Interaction):
 
 
 
+def _parse_pack_names(cards_json: bytes) -> set[str]:
+    """Collect the unique set names from a YGOPRODeck cardinfo response."""
+    card_data = _json_loads(cards_json)
+    return {card_set["set_name"] for card in card_data.get("data", ()) for card_set in card.get("card_sets", ())}
+
+PACKS_REFRESH_HOURS = 24  # How often the stored Master Duel set names are refreshed
+
+def get_cached_pack_names() -> list[str]:
+    """Return the stored Master Duel set names in name order (empty if never refreshed)."""
+    try:
+        with sqlite3.connect(DB_PATH) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT set_name FROM packs_cache ORDER BY set_name")
+            return [row[0] for row in cursor.fetchall()]
+    except Exception as e:
+        print(f"Error reading cached packs: {e}")
+        return []
+
+def save_pack_names(pack_names) -> None:
+    """Replace the stored set names with `pack_names` and record the refresh time."""
+    if not pack_names:
+        return
+    try:
+        now = time.time()
+        with sqlite3.connect(DB_PATH) as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO packs_cache (set_name, last_seen) VALUES (?, ?)
+                ON CONFLICT(set_name) DO UPDATE SET last_seen = excluded.last_seen
+            """, [(name, now) for name in pack_names])
+            # Sets missing from this refresh are no longer in the format
+            cursor.execute("DELETE FROM packs_cache WHERE last_seen < ?", (now,))
+            conn.commit()
+        set_metadata('packs_last_refreshed', datetime.now().isoformat())
+    except Exception as e:
+        print(f"Error saving cached packs: {e}")
+
+_packs_refresh_task: asyncio.Task | None = None  # Set-name refresh in flight, shared by the loop and /packs
+
+async def _download_pack_names() -> set[str]:
+    """Download the Master Duel card list, store its set names and return them."""
+    cards_content = await fetch_bytes("https://db.ygoprodeck.com/api/v7/cardinfo.php?format=master%20duel")
+    pack_names = await asyncio.to_thread(_parse_pack_names, cards_content)
+    await asyncio.to_thread(save_pack_names, pack_names)
+    return pack_names
+
+async def refresh_pack_names() -> set[str]:
+    """Refresh and return the stored set names, joining a refresh that is already running.
+
+    The download is shielded, so a caller that gets cancelled does not abort it for the others.
+    """
+    global _packs_refresh_task
+    if _packs_refresh_task is None or _packs_refresh_task.done():
+        _packs_refresh_task = asyncio.create_task(_download_pack_names())
+    return await asyncio.shield(_packs_refresh_task)
+
+async def refresh_packs_loop():
+    """Refresh the stored set names every PACKS_REFRESH_HOURS, counting from the last stored refresh."""
+    interval = PACKS_REFRESH_HOURS * 3600
+    while True:
+        last_refreshed = await asyncio.to_thread(get_metadata, 'packs_last_refreshed')
+        try:
+            elapsed = (datetime.now() - datetime.fromisoformat(last_refreshed)).total_seconds() if last_refreshed else interval
+        except ValueError:
+            elapsed = interval
+
+        if elapsed >= interval:
+            try:
+                pack_names = await refresh_pack_names()
+                print(f"Refreshed {len(pack_names)} pack names.")
+            except Exception as e:
+                print(f"Error refreshing pack names: {e}")
+            elapsed = 0
+        # Sleep only for what is left of the interval, so a restart does not push the refresh back
+        await asyncio.sleep(interval - elapsed)
+
+async def load_pack_names():
+    """Return the stored set names, fetching them live only if nothing is stored yet."""
+    pack_names = await asyncio.to_thread(get_cached_pack_names)
+    if not pack_names:
+        pack_names = await refresh_pack_names()
+    return pack_names
+
+async def fetch_new_packs() -> set[str]:
+    """Return the packs on the secret packs page released in the last 30 days."""
+    packs_content = await fetch_page("https://www.masterduelmeta.com/secret-packs")
+
+    # Only re-parse when the page changed; the date filter below still runs every time
+    pack_dates = _scrape_cache_for_body('pack_dates', packs_content)
+    if pack_dates is None:
+        pack_dates = await asyncio.to_thread(_parse_pack_dates, packs_content)
+        _scrape_cache['pack_dates'] = (time.time(), packs_content, pack_dates)
+
+    # The page uses UTC ISO-8601 timestamps, which order correctly as plain strings
+    cutoff_iso = (datetime.now(timezone.utc) - timedelta(days=30)).strftime('%Y-%m-%dT%H:%M:%S')
+    return {pack_name for pack_date_str, pack_name in pack_dates if pack_date_str >= cutoff_iso}
+
+# The strainer sees the raw class attribute (e.g. "pack svelte-x1"), so match the token
+_RE_PACK_CLASS = re.compile(r'(?:^|\s)pack(?:\s|$)')
+
+def _parse_pack_dates(html_bytes: bytes) -> list[tuple[str, str]]:
+    """Return (datetime string, pack name) for every dated pack on the secret packs page."""
+    # Only the pack cards (with their <time> and <h2> children) are needed
+    soup = BeautifulSoup(html_bytes, 'lxml', parse_only=SoupStrainer('div', class_=_RE_PACK_CLASS))
+
+    pack_dates = []
+    for pack_div in soup.find_all('div', class_='pack'):
+        date_element = pack_div.find('time')
+        if date_element:
+            pack_date_str = str(date_element.get('datetime', ''))
+            if pack_date_str:
+                name_element = pack_div.find('h2')
+                if name_element:
+                    pack_dates.append((pack_date_str, name_element.get_text(strip=True)))
+    return pack_dates
+
 @client.tree.command(name="packs", description="Show all packs in Master Duel and new ones.")
 async def packs(interaction: discord.Interaction):
     """Shows all packs in Master Duel and new ones."""
     await interaction.response.defer()
 
     try:
-        # Step 1: Fetch all cards for the "Master Duel" format
-        response = requests.get("https://db.ygoprodeck.com/api/v7/cardinfo.php?format=master%20duel")
-        response.raise_for_status()
-        card_data = response.json()
-
-        # Step 2: Extract unique set names
-        pack_names = set()
-        for card in card_data.get("data", []):
-            if "card_sets" in card:
-                for card_set in card["card_sets"]:
-                    pack_names.add(card_set["set_name"])
-
-        # Step 3: Fetch new packs from Master Duel Meta
-        secret_packs_url = "https://www.masterduelmeta.com/secret-packs"
-        response = requests.get(secret_packs_url, headers={'User-Agent': 'Mozilla/5.0'})
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-
-        new_packs = set()
-        thirty_days_ago = datetime.now() - timedelta(days=30)
-
-        for pack_div in soup.find_all('div', class_='pack'):
-            date_element = pack_div.find('time')
-            if date_element:
-                pack_date_str = str(date_element.get('datetime', ''))
-                if pack_date_str:
-                    pack_date = datetime.fromisoformat(pack_date_str.replace('Z', '+00:00'))
-                    if pack_date > thirty_days_ago:
-                        name_element = pack_div.find('h2')
-                        if name_element:
-                            new_packs.add(name_element.get_text(strip=True))
-
-        # Step 4: Format the output
-        all_packs = sorted(list(pack_names))
+        # The pack sets are cached rather than the embed, so the formatting below can change freely
+        cached_packs = _scrape_cache_get('packs')
+        if cached_packs is not None:
+            pack_names, new_packs = cached_packs
+        else:
+            # Step 1-3: Read the stored Master Duel set names (kept fresh by refresh_packs_loop)
+            # while the new packs are fetched from Master Duel Meta
+            pack_names, new_packs = await asyncio.gather(load_pack_names(), fetch_new_packs())
+            _scrape_cache['packs'] = (time.time(), None, (pack_names, new_packs))
+
+        # Step 4: Format the output; only the first 3 pages of 10 are shown, so only those are sorted
+        packs_per_page = 10
+        all_packs = heapq.nsmallest(3 * packs_per_page, pack_names)
         
         embed = discord.Embed(
             title="Yu-Gi-Oh! Master Duel Packs",
@@ -1723,22 +2206,18 @@ async def packs(interaction: discord.Interaction):
             embed.add_field(name="New & Upcoming Packs", value=new_packs_text, inline=False)
 
         if all_packs:
-            # Paginate the packs list
-            packs_per_page = 10
-            pages = [all_packs[i:i + packs_per_page] for i in range(0, len(all_packs), packs_per_page)]
-            
-            for i, page in enumerate(pages):
-                if i > 2: # Limit to 3 pages to avoid huge messages
-                    embed.add_field(name=f"And {len(all_packs) - (i * packs_per_page)} more...", value="...", inline=False)
-                    break
-                embed.add_field(name=f"Packs (Page {i+1})", value="\n".join(page), inline=True)
-
+            # Paginate the packs list, limited to 3 pages to avoid huge messages
+            remaining = len(pack_names) - len(all_packs)
+            for i in range(0, len(all_packs), packs_per_page):
+                embed.add_field(name=f"Packs (Page {i // packs_per_page + 1})", value="\n".join(all_packs[i:i + packs_per_page]), inline=True)
+            if remaining:
+                embed.add_field(name=f"And {remaining} more...", value="...", inline=False)
 
         embed.set_footer(text="Powered by YGOPRODeck and Master Duel Meta")
 
         await send_response(interaction, embed=embed)
 
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         await send_response(interaction, content=f"An error occurred while trying to fetch data: {e}")
     except Exception as e:
         await send_response(interaction, content=f"An unexpected error occurred: {e}")